@@ -8,14 +8,16 @@ Supports both interactive mode and command-line arguments.
 import os
 import argparse
 import sys
-import undetected_chromedriver as uc
 import questionary
-import json
+import orjson
 from src.g2_search import g2_search
 from src.g2_scrape import g2_scrape
 from src.capterra_search import capterra_search
 from src.capterra_scrape import capterra_scrape
-from src.utils import validate_date_range
+from src.utils import create_driver, validate_date_range
+
+# Maps characters that are unsafe in output filenames to safe replacements
+SAFE_FILENAME_TABLE = str.maketrans({" ": "_", "/": "-"})
 
 
 def main():
@@ -56,9 +58,7 @@ def main():
     print(f"Starting browser with profile: {user_data_dir}")
 
     # Initialize browser with persistent profile
-    options = uc.ChromeOptions()
-    options.add_argument(f"--user-data-dir={user_data_dir}")
-    driver = uc.Chrome(options=options, headless=False)
+    driver = create_driver(user_data_dir)
 
     # Get product name from CLI or prompt
     if cli_mode:
@@ -82,14 +82,15 @@ def main():
         else:  # capterra
             search_result = capterra_search(driver, query)
 
-        selected_product = None
         normalized_query = " ".join(query.split()).lower()
 
-        # Check for 100% match (excluding case and extra spaces)
-        for item in search_result:
-            if " ".join(item["name"].split()).lower() == normalized_query:
-                selected_product = item
-                break
+        # Check for 100% match (excluding case and extra spaces); results are
+        # indexed in reverse so the first of any duplicate names wins
+        results_by_name = {
+            " ".join(item["name"].split()).lower(): item
+            for item in reversed(search_result)
+        }
+        selected_product = results_by_name.get(normalized_query)
 
         # Handle no exact match based on mode
         if not selected_product:
@@ -143,14 +144,12 @@ def main():
         reviews = capterra_scrape(driver, selected_product["review_url"], date_range)
 
     # Create filename from product name and date range
-    safe_product_name = (
-        selected_product["product_name"].replace(" ", "_").replace("/", "-")
-    )
+    safe_product_name = selected_product["product_name"].translate(SAFE_FILENAME_TABLE)
     filename = f"{source}-{safe_product_name}-{date_range['start']}-to-{date_range['end']}.json"
 
     # Write reviews to file
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(reviews, f, indent=4, ensure_ascii=False)
+    with open(filename, "wb") as f:
+        f.write(orjson.dumps(reviews, option=orjson.OPT_INDENT_2))
 
     print(f"Reviews saved to {filename}")
     driver.quit()
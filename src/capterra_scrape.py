@@ -2,68 +2,150 @@
 Capterra review scraping functionality.
 """
 
-from bs4 import BeautifulSoup
-from .utils import check_captcha
+import asyncio
+import re
+from selectolax.lexbor import LexborHTMLParser
+from .utils import (
+    check_captcha,
+    create_http_session,
+    driver_wait,
+    fetch_page_html,
+    get_page_html,
+    update_session_cookies,
+)
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache, partial
+
+# CSS selectors for the fields of a Capterra review card
+SEL_REVIEW_CARD = "div.review-card"
+# Class of a review card in raw page HTML
+REVIEW_CARD_MARKER = "review-card"
+SEL_TITLE = "h3.fs-3"
+SEL_RATING = ".star-rating-component span.ms-1"
+SEL_REVIEWER_NAME = "div.fw-600"
+SEL_DETAILS = 'div[class="fs-4 text-neutral-90 mb-1"]'
+SEL_DATE = "div.d-lg-flex div.fs-5.text-neutral-90"
+SEL_REVIEW_TEXT = "div.d-lg-flex + div.fs-4.lh-2.text-neutral-99"
+SEL_PROS = 'div[class="my-3 my-lg-4"]'
+SEL_CONS = 'div[class="mb-3 mb-lg-4"]'
+SEL_SECTION_HEADER = "div.fw-600"
+SEL_SECTION_CONTENT = 'div[class="fs-4 lh-2 text-neutral-99"]'
+
+# Leading patterns that identify which date format parse_date is given
+ISO_DATE_RE = re.compile(r"\d{4}-")
+DAY_FIRST_DATE_RE = re.compile(r"\d{1,2} ")
+
+# Reviewer detail labels mapped to the CapterraReview field they fill
+DETAIL_FIELDS = {
+    "Source": "source",
+    "Used the Software for": "usage_duration",
+}
+
+# Turns a URL slug into space-separated words
+SLUG_TABLE = str.maketrans("-", " ")
+
+
+def _section_text(container, label):
+    """Return the content of a Pros/Cons section if its header matches label."""
+    header = container.css_first(SEL_SECTION_HEADER)
+    if not header or label not in header.text():
+        return None
+    content = container.css_first(SEL_SECTION_CONTENT)
+    return content.text(strip=True) if content else None
+
+
+def _text(node):
+    """Return the node's stripped text."""
+    return node.text(strip=True)
+
+
+def _title(node):
+    """Return the review title without its surrounding quotes."""
+    return node.text(strip=True).strip('"')
+
+
+def _rating(node):
+    """Return the star rating as a float, or None if it isn't numeric."""
+    try:
+        return float(node.text(strip=True))
+    except ValueError:
+        return None
+
+
+def _review_text(node):
+    """Return the main review text, preferring its inner span."""
+    span = node.css_first("span")
+    return (span or node).text(strip=True)
+
+
+# Single-node review fields: (CapterraReview field, selector, parser).
+# Parsers only run when the selector matches; otherwise the field keeps its default.
+FIELD_SCHEMA = (
+    ("title", SEL_TITLE, _title),
+    ("rating", SEL_RATING, _rating),
+    ("reviewer_name", SEL_REVIEWER_NAME, _text),
+    ("date", SEL_DATE, _text),
+    ("review_text", SEL_REVIEW_TEXT, _review_text),
+    ("pros", SEL_PROS, partial(_section_text, label="Pros:")),
+    ("cons", SEL_CONS, partial(_section_text, label="Cons:")),
+)
+
+
+@dataclass(slots=True)
+class CapterraReview:
+    """A single Capterra review. Serializes to JSON field-for-field via orjson."""
+
+    title: str | None = None
+    rating: float | None = None
+    reviewer_name: str | None = None
+    reviewer_role: str | None = None
+    business_type: str | None = None
+    business_size: str | None = None
+    usage_duration: str | None = None
+    source: str | None = None
+    is_verified_linkedin: bool = False
+    date: str | None = None
+    review_text: str | None = None
+    pros: str | None = None
+    cons: str | None = None
 
 
 def extract_reviews(html_content):
-    """Extract reviews from Capterra HTML content into structured JSON format."""
-    soup = BeautifulSoup(html_content, "html.parser")
+    """Extract reviews from Capterra HTML content into CapterraReview records."""
+    tree = LexborHTMLParser(html_content)
     reviews = []
 
     # Find all review cards
-    review_cards = soup.find_all("div", class_="review-card")
+    review_cards = tree.css(SEL_REVIEW_CARD)
 
     for card in review_cards:
-        review_data = {}
-
-        # Extract title
-        title_elem = card.find("h3", class_="fs-3")
-        review_data["title"] = (
-            title_elem.get_text(strip=True).strip('"') if title_elem else None
-        )
+        review = CapterraReview()
 
-        # Extract rating from star-rating-component
-        rating_elem = card.select_one(".star-rating-component span.ms-1")
-        if rating_elem:
-            try:
-                review_data["rating"] = float(rating_elem.get_text(strip=True))
-            except ValueError:
-                review_data["rating"] = None
-        else:
-            review_data["rating"] = None
-
-        # Extract reviewer name
-        name_elem = card.find("div", class_="fw-600")
-        review_data["reviewer_name"] = (
-            name_elem.get_text(strip=True) if name_elem else None
-        )
+        # Extract single-node fields (title, rating, name, date, text, pros, cons)
+        for field, selector, parse in FIELD_SCHEMA:
+            node = card.css_first(selector)
+            if node:
+                setattr(review, field, parse(node))
 
         # Extract reviewer details (role, company size, usage duration, source, linkedin verification)
-        detail_divs = card.find_all("div", class_="fs-4 text-neutral-90 mb-1")
-
-        review_data["reviewer_role"] = None
-        review_data["business_type"] = None
-        review_data["business_size"] = None
-        review_data["usage_duration"] = None
-        review_data["source"] = None
-        review_data["is_verified_linkedin"] = False
+        detail_divs = card.css(SEL_DETAILS)
 
         for div in detail_divs:
-            text = div.get_text(strip=True)
+            text = div.text(strip=True)
 
             # Check for Verified LinkedIn User
             if "Verified LinkedIn User" in text:
-                review_data["is_verified_linkedin"] = True
+                review.is_verified_linkedin = True
                 continue
 
-            # Check for Source
-            if text.startswith("Source:"):
-                review_data["source"] = text.replace("Source:", "").strip()
+            # Check for labelled fields ("Source: ...", "Used the Software for: ...")
+            label, colon, value = text.partition(":")
+            field = colon and DETAIL_FIELDS.get(label)
+            if field:
+                setattr(review, field, value.strip())
                 continue
 
             # Check for Employees (business type & size combined)
@@ -71,147 +153,195 @@ def extract_reviews(html_content):
                 # Split by comma - format is "Business Type, Size Employees"
                 parts = text.rsplit(",", 1)
                 if len(parts) == 2:
-                    review_data["business_type"] = parts[0].strip()
-                    review_data["business_size"] = parts[1].strip()
+                    review.business_type = parts[0].strip()
+                    review.business_size = parts[1].strip()
                 else:
-                    review_data["business_size"] = text
-                continue
-
-            # Check for usage duration
-            if "Used the Software for:" in text:
-                review_data["usage_duration"] = text.replace(
-                    "Used the Software for:", ""
-                ).strip()
+                    review.business_size = text
                 continue
 
             # Otherwise it's likely the role (first non-matched field)
-            if text and review_data["reviewer_role"] is None:
-                review_data["reviewer_role"] = text
-
-        # Extract date - it's inside the div after h3 title, within the d-lg-flex container
-        date_elem = card.select_one("div.d-lg-flex div.fs-5.text-neutral-90")
-        if date_elem:
-            date_text = date_elem.get_text(strip=True)
-            review_data["date"] = date_text
-        else:
-            review_data["date"] = None
-
-        # Extract main review text (the span directly after the rating section)
-        review_text_elem = card.select_one(
-            "div.d-lg-flex + div.fs-4.lh-2.text-neutral-99"
-        )
-        if review_text_elem:
-            span = review_text_elem.find("span")
-            review_data["review_text"] = (
-                span.get_text(strip=True)
-                if span
-                else review_text_elem.get_text(strip=True)
-            )
-        else:
-            review_data["review_text"] = None
-
-        # Extract Pros - find div with "Pros:" text and get sibling content
-        pros_container = card.find("div", class_="my-3 my-lg-4")
-        if pros_container:
-            pros_header = pros_container.find("div", class_="fw-600")
-            if pros_header and "Pros:" in pros_header.get_text():
-                pros_content = pros_container.find(
-                    "div", class_="fs-4 lh-2 text-neutral-99"
-                )
-                review_data["pros"] = (
-                    pros_content.get_text(strip=True) if pros_content else None
-                )
-            else:
-                review_data["pros"] = None
-        else:
-            review_data["pros"] = None
-
-        # Extract Cons - find div with "Cons:" text and get sibling content
-        cons_container = card.find("div", class_="mb-3 mb-lg-4")
-        if cons_container:
-            cons_header = cons_container.find("div", class_="fw-600")
-            if cons_header and "Cons:" in cons_header.get_text():
-                cons_content = cons_container.find(
-                    "div", class_="fs-4 lh-2 text-neutral-99"
-                )
-                review_data["cons"] = (
-                    cons_content.get_text(strip=True) if cons_content else None
-                )
-            else:
-                review_data["cons"] = None
-        else:
-            review_data["cons"] = None
+            if text and review.reviewer_role is None:
+                review.reviewer_role = text
 
-        reviews.append(review_data)
+        reviews.append(review)
 
     return reviews
 
 
+@lru_cache(maxsize=4096)
 def parse_date(date_string):
     """Parse Capterra date format to datetime object."""
     if not date_string:
         return None
-    try:
+    date_string = date_string.strip()
+
+    # Pick the format up front instead of trying each one in turn
+    if ISO_DATE_RE.match(date_string):
         # ISO format from date_range: "2024-01-01"
-        return datetime.strptime(date_string.strip(), "%Y-%m-%d")
-    except:
-        pass
-    try:
+        date_format = "%Y-%m-%d"
+    elif DAY_FIRST_DATE_RE.match(date_string):
         # Capterra format: "17 February 2025"
-        return datetime.strptime(date_string.strip(), "%d %B %Y")
-    except:
-        pass
-    try:
+        date_format = "%d %B %Y"
+    else:
         # Alternate format: "February 17, 2025"
-        return datetime.strptime(date_string.strip(), "%B %d, %Y")
-    except:
+        date_format = "%B %d, %Y"
+
+    try:
+        return datetime.strptime(date_string, date_format)
+    except ValueError:
         return None
 
 
+def page_url(product_link, page_num):
+    """Build the URL of a review page, sorted newest first."""
+    return f"{product_link}?page={page_num}&sort=most_recent"
+
+
 def get_page_reviews(driver, product_link, page_num):
     """Fetch and extract reviews from a specific page."""
-    product_name = product_link.rstrip("/").split("/")[-1].replace("-", " ").title()
+    product_name = product_link.rstrip("/").rpartition("/")[2].translate(SLUG_TABLE)
+    product_name = product_name.title()
     print(f"Fetching page {page_num} for {product_name}")
 
-    url = f"{product_link}?page={page_num}&sort=most_recent"
-
-    driver.get(url)
+    driver.get(page_url(product_link, page_num))
     check_captcha(driver)
 
-    wait = WebDriverWait(driver, 10)
     try:
-        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "div.review-card")))
+        driver_wait(driver).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, SEL_REVIEW_CARD))
+        )
     except:
         return []
 
-    html_content = driver.page_source
+    html_content = get_page_html(driver)
     return extract_reviews(html_content)
 
 
-def filter_reviews_by_date(reviews, start_date, end_date):
-    """Filter reviews to only include those within date range."""
-    filtered = []
-    for review in reviews:
-        if review.get("date"):
-            review_date = parse_date(review["date"])
-            if review_date and start_date <= review_date <= end_date:
-                filtered.append(review)
-    return filtered
+def page_dates(reviews):
+    """Parse every review's date once per page (None where missing or invalid)."""
+    return [parse_date(review.date) for review in reviews]
+
+
+def page_date_bounds(dates):
+    """Get the earliest and latest of a page's parsed review dates."""
+    dates = [d for d in dates if d]
+
+    if not dates:
+        return None, None
+    return min(dates), max(dates)
+
+
+def filter_reviews_by_date(reviews, dates, start_date, end_date):
+    """Filter reviews to only those whose parsed date falls within the range."""
+    return [
+        review
+        for review, date in zip(reviews, dates)
+        if date and start_date <= date <= end_date
+    ]
+
+
+async def collect_reviews(
+    driver, product_link, start_date, end_date, max_empty_pages, max_concurrency
+):
+    """
+    Walk review pages in batches of max_concurrency until the reviews run out,
+    a page is entirely older than start_date, or max_empty_pages consecutive
+    pages have no reviews in the date range.
+
+    Returns:
+        Tuple of (matching reviews, consecutive empty pages at stop)
+    """
+    all_reviews = []
+    consecutive_empty_pages = 0
+    first_page = 1
+    finished = False
+
+    async with create_http_session(driver, max_concurrency) as session:
+        while consecutive_empty_pages < max_empty_pages and not finished:
+            batch = range(first_page, first_page + max_concurrency)
+            batch_pages = await asyncio.gather(
+                *(
+                    fetch_page_html(
+                        session, page_url(product_link, page), REVIEW_CARD_MARKER
+                    )
+                    for page in batch
+                )
+            )
+
+            # Walk the batch in page order so termination matches a linear scan
+            for page_num, html_content in zip(batch, batch_pages):
+                if html_content is None:
+                    # Blocked over HTTP: load it in the browser, then reuse
+                    # whatever cookies the browser picked up
+                    print(f"Page {page_num}: HTTP fetch blocked, using browser")
+                    page_reviews = get_page_reviews(driver, product_link, page_num)
+                    update_session_cookies(session, driver)
+                else:
+                    page_reviews = extract_reviews(html_content)
+
+                # No reviews on page means we've hit the end
+                if not page_reviews:
+                    print(f"Page {page_num}: No reviews found (end of reviews)")
+                    finished = True
+                    break
+
+                # Pages are sorted newest first, so once a whole page predates
+                # the range every later page does too
+                dates = page_dates(page_reviews)
+                earliest, latest = page_date_bounds(dates)
+                if latest and latest < start_date:
+                    print(f"Page {page_num}: All reviews predate {start_date.date()}")
+                    finished = True
+                    break
+
+                # Pages entirely newer than the range can't match and aren't
+                # counted as empty, since matching pages are still ahead
+                if earliest and earliest > end_date:
+                    continue
+
+                # Filter reviews by date
+                matching_reviews = filter_reviews_by_date(
+                    page_reviews, dates, start_date, end_date
+                )
+
+                if matching_reviews:
+                    print(
+                        f"Page {page_num}: Found {len(matching_reviews)} matching reviews (of {len(page_reviews)} total)"
+                    )
+                    all_reviews.extend(matching_reviews)
+                    consecutive_empty_pages = 0
+                else:
+                    consecutive_empty_pages += 1
+                    if consecutive_empty_pages >= max_empty_pages:
+                        break
 
+            first_page = batch.stop
 
-def capterra_scrape(driver, product_link, date_range, max_empty_pages=8):
+    return all_reviews, consecutive_empty_pages
+
+
+def capterra_scrape(
+    driver, product_link, date_range, max_empty_pages=8, max_concurrency=16
+):
     """
     Scrape Capterra reviews for a product within a date range.
-    Uses linear search with early termination after consecutive empty pages.
+    Uses linear search over newest-first pages, stopping at the first page
+    older than the range or after consecutive empty pages.
+
+    Review pages are server-rendered, so they are fetched concurrently over
+    HTTP using the browser's cookies and User-Agent. The browser itself is
+    only used for pages that fail over HTTP or are served a CAPTCHA, after
+    which its refreshed cookies are copied back into the HTTP session.
 
     Args:
         driver: Selenium WebDriver instance
         product_link: Full URL to the product page
         date_range: Dict with 'start'/'from' and 'end'/'to' keys
         max_empty_pages: Stop after this many consecutive pages with no matching reviews
+        max_concurrency: Number of pages fetched concurrently
 
     Returns:
-        List of review dictionaries
+        List of CapterraReview records
     """
     start_date = date_range.get("start") or date_range.get("from")
     end_date = date_range.get("end") or date_range.get("to")
@@ -223,33 +353,13 @@ def capterra_scrape(driver, product_link, date_range, max_empty_pages=8):
     start_date = parse_date(start_date) if isinstance(start_date, str) else start_date
     end_date = parse_date(end_date) if isinstance(end_date, str) else end_date
 
-    all_reviews = []
-    consecutive_empty_pages = 0
-    page_num = 1
-
     print(f"Searching for reviews between {start_date.date()} and {end_date.date()}")
 
-    while consecutive_empty_pages < max_empty_pages:
-        page_reviews = get_page_reviews(driver, product_link, page_num)
-
-        # No reviews on page means we've hit the end
-        if not page_reviews:
-            print(f"Page {page_num}: No reviews found (end of reviews)")
-            break
-
-        # Filter reviews by date
-        matching_reviews = filter_reviews_by_date(page_reviews, start_date, end_date)
-
-        if matching_reviews:
-            print(
-                f"Page {page_num}: Found {len(matching_reviews)} matching reviews (of {len(page_reviews)} total)"
-            )
-            all_reviews.extend(matching_reviews)
-            consecutive_empty_pages = 0
-        else:
-            consecutive_empty_pages += 1
-
-        page_num += 1
+    all_reviews, consecutive_empty_pages = asyncio.run(
+        collect_reviews(
+            driver, product_link, start_date, end_date, max_empty_pages, max_concurrency
+        )
+    )
 
     if consecutive_empty_pages >= max_empty_pages:
         print(
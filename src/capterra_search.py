@@ -2,15 +2,17 @@
 Capterra product search functionality.
 """
 
-from .utils import check_captcha
+from .utils import check_captcha, driver_wait, get_page_html
 
-import time
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 from urllib.parse import quote_plus
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 
+# CSS selectors for Capterra search result cards
+SEL_PRODUCT_LINK = 'a.entry[data-evcmp="product-card_search"]'
+SEL_PRODUCT_IMG = "img.search-results__thumbnail__img"
+
 
 def capterra_search(driver, query):
     """
@@ -30,27 +32,26 @@ def capterra_search(driver, query):
     driver.get(url)
 
     # Wait for page to load
-    WebDriverWait(driver, 10).until(
-        EC.presence_of_element_located((By.TAG_NAME, "body"))
-    )
+    driver_wait(driver).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
 
     check_captcha(driver)
 
     # Wait for search results to load
     try:
-        WebDriverWait(driver, 10).until(
+        driver_wait(driver).until(
             EC.presence_of_element_located(
                 (By.CSS_SELECTOR, 'div.search-result-item, a[href*="/software/"]')
             )
         )
+        # Wait for the product cards extract_products_and_reviews reads
+        driver_wait(driver, 5).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, SEL_PRODUCT_LINK))
+        )
     except:
         # No results found or timeout
         pass
 
-    # Small buffer to ensure page is fully settled
-    time.sleep(1)
-
-    html_content = driver.page_source
+    html_content = get_page_html(driver)
     return extract_products_and_reviews(html_content)
 
 
@@ -64,12 +65,12 @@ def extract_products_and_reviews(html_content):
     Returns:
         List of dicts containing product name, slug, and review URL
     """
-    soup = BeautifulSoup(html_content, "html.parser")
+    tree = LexborHTMLParser(html_content)
     products = []
     seen_names = set()
 
     # Select the main product card links
-    links = soup.select('a.entry[data-evcmp="product-card_search"]')
+    links = tree.css(SEL_PRODUCT_LINK)
 
     for link in links:
         # Stop after collecting 5 products
@@ -78,16 +79,16 @@ def extract_products_and_reviews(html_content):
 
         try:
             # Extract product name from img alt attribute
-            img_elem = link.select_one("img.search-results__thumbnail__img")
+            img_elem = link.css_first(SEL_PRODUCT_IMG)
             if not img_elem:
                 continue
 
-            name = img_elem.get("alt", "").strip()
+            name = (img_elem.attributes.get("alt") or "").strip()
             if not name:
                 continue
 
             # Extract href (review site URL)
-            href = link.get("href")
+            href = link.attributes.get("href")
             if not href:
                 continue
 
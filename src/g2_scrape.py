@@ -2,179 +2,400 @@
 G2 review scraping functionality.
 """
 
-from bs4 import BeautifulSoup
-from .utils import check_captcha
+import asyncio
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from selectolax.lexbor import LexborHTMLParser
+from .utils import (
+    AdaptiveThrottle,
+    check_captcha,
+    create_driver,
+    create_http_session,
+    driver_wait,
+    fetch_page_html,
+    get_page_html,
+    update_session_cookies,
+)
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from dataclasses import dataclass, field
 from datetime import datetime
-from time import sleep
-import random
+from functools import lru_cache
+
+# Maximum number of browsers fetching G2 pages at once
+MAX_SCRAPPER_WORKERS = int(os.environ.get("MAX_SCRAPPER_WORKERS", 4))
+
+# Maximum number of G2 pages requested over HTTP at once
+MAX_HTTP_CONCURRENCY = int(os.environ.get("MAX_HTTP_CONCURRENCY", 8))
+
+# Shared by every worker browser so a CAPTCHA on one slows all of them down
+THROTTLE = AdaptiveThrottle()
+
+# CSS selectors for a G2 review article and its fields
+SEL_REVIEW = 'article[itemprop="review"]'
+SEL_TITLE = 'div[itemprop="name"]'
+SEL_RATING = 'meta[itemprop="ratingValue"]'
+SEL_REVIEWER_NAME = 'meta[itemprop="name"]'
+SEL_ROLE = (
+    "div.elv-tracking-normal.elv-font-figtree.elv-text-xs.elv-leading-xs"
+    ".elv-font-normal.elv-text-subtle"
+)
+SEL_DATE = 'meta[itemprop="datePublished"]'
+# Q&A sections of the visible review body and the hidden "Show More" accordion
+SEL_BODY_SECTION = 'div[itemprop="reviewBody"] section'
+SEL_REVIEW_SECTION = (
+    f"{SEL_BODY_SECTION}, "
+    'div[data-elv--accordion--show-more-controller-target="panel"] section'
+)
+SEL_QUESTION = (
+    "div.elv-tracking-normal.elv-text-default.elv-font-figtree.elv-text-base"
+    ".elv-leading-base.elv-font-bold"
+)
+SEL_ANSWER = (
+    "p.elv-tracking-normal.elv-text-default.elv-font-figtree.elv-text-base"
+    ".elv-leading-base"
+)
+
+# G2 review dates (and date_range bounds): "2025-12-23"
+ISO_DATE_RE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})")
+
+# Footer G2 appends to review answers
+HOSTED_ON_G2 = "Review collected by and hosted on G2.com."
+
+# Markup of a review article's attribute, opening and closing tags, used to
+# cut the review list out of the page before parsing
+REVIEW_MARKER = 'itemprop="review"'
+REVIEW_ARTICLE_RE = re.compile(r'<article\b[^>]*\bitemprop="review"')
+ARTICLE_CLOSE = "</article>"
+
+# Attribute of "Show More" accordion panels; short reviews don't have one
+ACCORDION_MARKER = "accordion--show-more-controller-target"
+
+# Heading of the error page G2 serves past the last page of reviews
+SERVER_ERROR_MARKER = '<h1 class="error-text-number">500</h1>'
+
+# Review listing for a product, newest first
+REVIEWS_URL = (
+    "https://www.g2.com/products/{product}/reviews"
+    "?filters%5Bcomment_answer_values%5D=&order=most_recent&page={page_num}#reviews"
+)
+
+
+def _extract_qa(section):
+    """Return a review section's (question, answer) pair, or None if incomplete."""
+    question_elem = section.css_first(SEL_QUESTION)
+    answer_elem = section.css_first(SEL_ANSWER)
+    if not (question_elem and answer_elem):
+        return None
+
+    answer = answer_elem.text(strip=True)
+    if HOSTED_ON_G2 in answer:
+        answer = answer.replace(HOSTED_ON_G2, "").strip()
+    return question_elem.text(strip=True), answer
+
+
+def _review_markup(html_content):
+    """
+    Return the part of the page from the first review article to the last
+    closing article tag, or the whole page if it has no review articles.
+
+    Scripts, navigation and footer around the review list never reach the
+    parser, which is most of a G2 page.
+    """
+    for match in REVIEW_ARTICLE_RE.finditer(html_content):
+        start = match.start()
+        # Skip review markup inside inline scripts (client-side templates)
+        script_start = html_content.rfind("<script", 0, start)
+        if script_start == -1 or "</script" in html_content[script_start:start]:
+            break
+    else:
+        return html_content
+
+    end = html_content.rfind(ARTICLE_CLOSE)
+    if end < start:
+        return html_content
+    return html_content[start : end + len(ARTICLE_CLOSE)]
+
+
+@dataclass(slots=True)
+class G2Review:
+    """
+    A single G2 review. Serializes to JSON field-for-field via orjson, which
+    leaves out the underscore-prefixed parsed date.
+    """
+
+    title: str | None = None
+    rating: float | None = None
+    reviewer_name: str | None = None
+    reviewer_role: str | None = None
+    business_size: str | None = None
+    date: str | None = None
+    _date: datetime | None = None
+    review: dict[str, str] = field(default_factory=dict)
 
 
 def extract_reviews(html_content):
-    """Extract reviews from G2 HTML content into structured JSON format."""
-    soup = BeautifulSoup(html_content, "html.parser")
+    """Extract reviews from G2 HTML content into G2Review records."""
+    review_markup = _review_markup(html_content)
+    tree = LexborHTMLParser(review_markup)
     reviews = []
 
+    # Only match accordion panels when the page has any
+    if ACCORDION_MARKER in review_markup:
+        section_selector = SEL_REVIEW_SECTION
+    else:
+        section_selector = SEL_BODY_SECTION
+
     # Find all review articles
-    articles = soup.find_all("article", {"itemprop": "review"})
+    articles = tree.css(SEL_REVIEW)
 
     for article in articles:
-        review_data = {}
+        review = G2Review()
 
         # Extract title
-        title_elem = article.find("div", {"itemprop": "name"})
-        review_data["title"] = title_elem.get_text(strip=True) if title_elem else None
+        title_elem = article.css_first(SEL_TITLE)
+        if title_elem:
+            review.title = title_elem.text(strip=True)
 
         # Extract rating
-        rating_elem = article.find("meta", {"itemprop": "ratingValue"})
-        review_data["rating"] = (
-            float(rating_elem.get("content")) if rating_elem else None
-        )
+        rating_elem = article.css_first(SEL_RATING)
+        if rating_elem:
+            review.rating = float(rating_elem.attributes.get("content"))
 
         # Extract reviewer name
-        name_elem = article.find("meta", {"itemprop": "name"})
-        review_data["reviewer_name"] = name_elem.get("content") if name_elem else None
+        name_elem = article.css_first(SEL_REVIEWER_NAME)
+        if name_elem:
+            review.reviewer_name = name_elem.attributes.get("content")
 
         # Extract reviewer role and business size
-        role_divs = article.find_all(
-            "div",
-            class_="elv-tracking-normal elv-font-figtree elv-text-xs elv-leading-xs elv-font-normal elv-text-subtle",
-        )
+        role_divs = article.css(SEL_ROLE)
         if len(role_divs) >= 2:
-            review_data["reviewer_role"] = role_divs[0].get_text(strip=True)
+            review.reviewer_role = role_divs[0].text(strip=True)
             # Business size is usually the last one
-            review_data["business_size"] = role_divs[-1].get_text(strip=True)
-        else:
-            review_data["reviewer_role"] = None
-            review_data["business_size"] = None
+            review.business_size = role_divs[-1].text(strip=True)
 
         # Extract date
-        date_elem = article.find("meta", {"itemprop": "datePublished"})
-        review_data["date"] = date_elem.get("content") if date_elem else None
-
-        # Extract review content by sections
-        review_body = article.find("div", {"itemprop": "reviewBody"})
-        review_data["review"] = {}
-
-        # Collect all sections from visible review body
-        if review_body:
-            sections = review_body.find_all("section")
-            for section in sections:
-                question_elem = section.find(
-                    "div",
-                    class_="elv-tracking-normal elv-text-default elv-font-figtree elv-text-base elv-leading-base elv-font-bold",
-                )
-                answer_elem = section.find(
-                    "p",
-                    class_="elv-tracking-normal elv-text-default elv-font-figtree elv-text-base elv-leading-base",
-                )
-
-                if question_elem and answer_elem:
-                    question = question_elem.get_text(strip=True)
-                    answer = answer_elem.get_text(strip=True)
-                    # Remove "Review collected by and hosted on G2.com." text
-                    answer = answer.replace(
-                        "Review collected by and hosted on G2.com.", ""
-                    ).strip()
-                    review_data["review"][question] = answer
-
-        # Extract hidden content from "Show More" accordion
-        accordion_panel = article.find(
-            "div", {"data-elv--accordion--show-more-controller-target": "panel"}
-        )
-        if accordion_panel:
-            hidden_sections = accordion_panel.find_all("section")
-            for section in hidden_sections:
-                question_elem = section.find(
-                    "div",
-                    class_="elv-tracking-normal elv-text-default elv-font-figtree elv-text-base elv-leading-base elv-font-bold",
-                )
-                answer_elem = section.find(
-                    "p",
-                    class_="elv-tracking-normal elv-text-default elv-font-figtree elv-text-base elv-leading-base",
-                )
-
-                if question_elem and answer_elem:
-                    question = question_elem.get_text(strip=True)
-                    answer = answer_elem.get_text(strip=True)
-                    # Remove "Review collected by and hosted on G2.com." text
-                    answer = answer.replace(
-                        "Review collected by and hosted on G2.com.", ""
-                    ).strip()
-                    review_data["review"][question] = answer
-
-        reviews.append(review_data)
+        date_elem = article.css_first(SEL_DATE)
+        if date_elem:
+            review.date = date_elem.attributes.get("content")
+            # Parsed once here so date filtering never re-parses
+            review._date = parse_date(review.date)
+
+        # Extract review content by sections, visible and "Show More" alike
+        for section in article.css(section_selector):
+            qa = _extract_qa(section)
+            if qa:
+                question, answer = qa
+                review.review[question] = answer
+
+        reviews.append(review)
 
     return reviews
 
 
+@lru_cache(maxsize=4096)
 def parse_date(date_string):
     """Parse G2 date format to datetime object."""
+    if not date_string:
+        return None
+
+    # Build the datetime directly instead of going through strptime
+    match = ISO_DATE_RE.fullmatch(date_string)
+    if not match:
+        return None
     try:
-        return datetime.strptime(date_string, "%Y-%m-%d")
-    except:
+        return datetime(*map(int, match.groups()))
+    except ValueError:
+        # Out-of-range month or day
         return None
 
 
 def get_page_reviews(driver, product, page_num):
     """Fetch and extract reviews from a specific page."""
     print(f"Fetching page {page_num} for product {product}")
-    url = f"https://www.g2.com/products/{product}/reviews?filters%5Bcomment_answer_values%5D=&order=most_recent&page={page_num}#reviews"
+    url = REVIEWS_URL.format(product=product, page_num=page_num)
+    THROTTLE.wait()
     driver.get(url)
-    check_captcha(driver)
+    html_content = get_page_html(driver)
+    # Pages with reviews are usable even if they mention a CAPTCHA (e.g. the
+    # reCAPTCHA script), so only a challenge without reviews counts as blocked
+    THROTTLE.record(
+        REVIEW_MARKER not in html_content and check_captcha(driver, html_content)
+    )
 
     # Check for 500 error page
-    html_content = driver.page_source
-    if '<h1 class="error-text-number">500</h1>' in html_content:
+    if SERVER_ERROR_MARKER in html_content:
         print(f"Page {page_num} returned 500 error - no more reviews")
         return []
 
-    wait = WebDriverWait(driver, 10)
-    try:
-        wait.until(
-            EC.presence_of_element_located(
-                (By.CSS_SELECTOR, 'article[itemprop="review"]')
+    # Reviews are usually already rendered; only wait (and re-read) if not
+    if REVIEW_MARKER not in html_content:
+        try:
+            driver_wait(driver).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, SEL_REVIEW))
             )
-        )
-    except:
-        return []
+        except:
+            return []
+
+        html_content = get_page_html(driver)
 
-    html_content = driver.page_source
     return extract_reviews(html_content)
 
 
 def filter_reviews_by_date(reviews, start_date, end_date):
     """Filter reviews to only include those within date range."""
-    filtered = []
-    for review in reviews:
-        if review.get("date"):
-            review_date = parse_date(review["date"])
-            if review_date and start_date <= review_date <= end_date:
-                filtered.append(review)
-    return filtered
+    return [
+        review
+        for review in reviews
+        if review._date and start_date <= review._date <= end_date
+    ]
 
 
-def find_page_range(driver, product, start_date, end_date, max_page=1000):
+async def fetch_pages_html(
+    drivers, product, pages, max_concurrency=MAX_HTTP_CONCURRENCY
+):
+    """
+    Fetch the given review pages over HTTP as the browsers, at most
+    max_concurrency at a time.
+
+    The session takes the first driver's User-Agent and the cookies of every
+    driver, so a challenge solved in any worker browser carries over.
+    """
+    # Queued pages wait here rather than in the connection pool, so they
+    # don't spend their request timeout waiting for a free connection
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch(page):
+        async with semaphore:
+            return await fetch_page_html(
+                session,
+                REVIEWS_URL.format(product=product, page_num=page),
+                REVIEW_MARKER,
+                # G2's past-the-last-page error is a valid (empty) page
+                error_marker=SERVER_ERROR_MARKER,
+            )
+
+    async with create_http_session(drivers[0], max_concurrency) as session:
+        for worker_driver in drivers[1:]:
+            update_session_cookies(session, worker_driver)
+        return await asyncio.gather(*(fetch(page) for page in pages))
+
+
+@contextmanager
+def page_fetcher(driver, product, max_workers=MAX_SCRAPPER_WORKERS):
+    """
+    Yield a function that fetches several review pages concurrently.
+
+    Review pages are server-rendered, so each batch is first fetched over
+    HTTP using the browsers' cookies and User-Agent, at most
+    MAX_HTTP_CONCURRENCY requests at a time. Pages that fail or are served a
+    CAPTCHA are loaded in browsers instead, one per worker thread; the next
+    batch picks up whatever cookies any of the browsers earned. While
+    THROTTLE is backing off, batches skip HTTP and go straight to the browsers.
+
+    The caller's driver serves the first worker; further workers launch their
+    own browsers with separate profiles on first use. These stay open for
+    every batch and are quit when the context exits.
+
+    Yields:
+        fetch_pages(pages) returning the page reviews in the same order as pages
+    """
+    spare_drivers = [driver]
+    extra_drivers = []
+    launch_lock = threading.Lock()
+    local = threading.local()
+
+    def fetch(page):
+        if not hasattr(local, "driver"):
+            # Launch browsers one at a time; undetected_chromedriver patches
+            # its driver binary on startup
+            with launch_lock:
+                if spare_drivers:
+                    local.driver = spare_drivers.pop()
+                else:
+                    user_data_dir = os.path.join(
+                        os.getcwd(), f"chrome_profile_{len(extra_drivers) + 1}"
+                    )
+                    print(f"Starting worker browser with profile: {user_data_dir}")
+                    local.driver = create_driver(user_data_dir)
+                    extra_drivers.append(local.driver)
+
+        return get_page_reviews(local.driver, product, page)
+
+    def fetch_pages(pages):
+        if THROTTLE.delay:
+            # Browsers are backing off after a CAPTCHA; leave every page to
+            # them until they load cleanly again
+            print(f"Throttled, loading {len(pages)} pages in browser")
+            html_pages = [None] * len(pages)
+        else:
+            html_pages = asyncio.run(
+                fetch_pages_html([driver, *extra_drivers], product, pages)
+            )
+            if None in html_pages:
+                blocked_count = html_pages.count(None)
+                print(f"{blocked_count} pages blocked over HTTP, using browser")
+        html_by_page = dict(zip(pages, html_pages))
+
+        blocked_pages = [page for page, html in html_by_page.items() if html is None]
+        page_reviews = dict(zip(blocked_pages, executor.map(fetch, blocked_pages)))
+
+        for page, html_content in html_by_page.items():
+            if html_content is not None:
+                page_reviews[page] = extract_reviews(html_content)
+        return [page_reviews[page] for page in pages]
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            yield fetch_pages
+    finally:
+        for extra_driver in extra_drivers:
+            extra_driver.quit()
+
+
+def find_page_range(
+    driver,
+    product,
+    start_date,
+    end_date,
+    max_page=1000,
+    max_workers=MAX_SCRAPPER_WORKERS,
+):
     """
     Use optimized binary search to find the page range containing reviews within date range.
     Returns: (first_page, last_page, all_reviews_in_range)
 
     Since reviews are ordered most_recent, earlier pages have newer dates.
     Optimization: Seed search based on date distribution from first page to avoid unnecessary searches.
+    Pages are loaded through a pool of browsers: independent exponential-search
+    probes in batches, and binary-search midpoints together with both possible
+    next midpoints.
     """
+    with page_fetcher(driver, product, max_workers) as fetch_pages:
+        return _find_page_range(
+            fetch_pages, start_date, end_date, max_page, max_workers
+        )
+
+
+def _find_page_range(fetch_pages, start_date, end_date, max_page, max_workers):
+    """find_page_range body, loading pages through fetch_pages."""
     start_date = parse_date(start_date) if isinstance(start_date, str) else start_date
     end_date = parse_date(end_date) if isinstance(end_date, str) else end_date
 
     # Cache to avoid re-fetching pages
     page_cache = {}
-    all_reviews = []
+
+    def prefetch(pages):
+        """Load the given pages that are not cached yet, in parallel."""
+        missing = [page for page in dict.fromkeys(pages) if page not in page_cache]
+        if missing:
+            page_cache.update(zip(missing, fetch_pages(missing)))
 
     def get_cached_page(page):
-        if page not in page_cache:
-            page_cache[page] = get_page_reviews(driver, product, page)
-            sleep(random.randint(300, 500) / 100)
+        prefetch([page])
         return page_cache[page]
 
     def get_page_date_range(page):
@@ -183,8 +404,7 @@ def find_page_range(driver, product, start_date, end_date, max_page=1000):
         if not reviews:
             return None, None
 
-        dates = [parse_date(r["date"]) for r in reviews if r.get("date")]
-        dates = [d for d in dates if d]
+        dates = [r._date for r in reviews if r._date]
 
         if not dates:
             return None, None
@@ -199,8 +419,7 @@ def find_page_range(driver, product, start_date, end_date, max_page=1000):
         return None, None, []
 
     # Get date range from first page
-    page_1_dates = [parse_date(r["date"]) for r in page_1_reviews if r.get("date")]
-    page_1_dates = [d for d in page_1_dates if d]
+    page_1_dates = [r._date for r in page_1_reviews if r._date]
 
     if not page_1_dates:
         print("No valid dates on first page")
@@ -230,11 +449,6 @@ def find_page_range(driver, product, start_date, end_date, max_page=1000):
     else:
         max_page = 100  # Fallback
 
-    # If target end_date is newer than newest review, no results possible
-    if end_date < oldest_date_page_1:
-        print("Target date range ends before oldest review on page 1")
-        return None, None, []
-
     # If target start_date is newer than newest review, no results possible
     if start_date > newest_date:
         print("Target date range starts after newest review")
@@ -248,6 +462,7 @@ def find_page_range(driver, product, start_date, end_date, max_page=1000):
     if start_date <= latest_p1 and earliest_p1 <= end_date:
         first_page = 1
     else:
+        # Page 1 is entirely newer than the range
         # Use smarter initial search based on estimated position
         if days_per_page > 0:
             estimated_start_page = max(
@@ -257,45 +472,48 @@ def find_page_range(driver, product, start_date, end_date, max_page=1000):
         else:
             probe_page = 2
 
-        # Exponential search to find rough bounds
-        first_page = None
+        probe_pages = []
         step = 1
         while probe_page <= max_page:
-            earliest, latest = get_page_date_range(probe_page)
-
-            if earliest is None:
-                break
-
-            # Check if this page overlaps with target date range
-            if start_date <= latest and earliest <= end_date:
-                # Found a page in range, narrow down with binary search
-                left = max(1, probe_page // 2) if probe_page > 1 else 1
-                right = probe_page
-
-                while left <= right:
-                    mid = (left + right) // 2
-                    earliest, latest = get_page_date_range(mid)
-
-                    if earliest is None:
-                        right = mid - 1
-                        continue
-
-                    if latest < start_date:
-                        right = mid - 1
-                    elif earliest > end_date:
-                        left = mid + 1
-                    else:
-                        first_page = mid
-                        right = mid - 1
-                break
-            elif latest < start_date:
-                # Gone too far, target is earlier
-                break
-
-            # Keep searching forward
+            probe_pages.append(probe_page)
             probe_page += step
             step *= 2
 
+        # Exponential search for the first page that is not entirely newer
+        # than the range; the probes are independent, so load a batch at once
+        too_new_page, first_page = 1, None
+        for i, probe_page in enumerate(probe_pages):
+            if i % max_workers == 0:
+                prefetch(probe_pages[i : i + max_workers])
+            earliest, latest = get_page_date_range(probe_page)
+
+            if earliest is not None and earliest > end_date:
+                too_new_page = probe_page
+                continue
+            first_page = probe_page
+            break
+
+        if first_page is not None:
+            # Narrow down with binary search between the bracketing probes
+            left, right = too_new_page + 1, first_page
+
+            while left < right:
+                mid = (left + right) // 2
+                # Speculatively load both midpoints the next step could pick
+                prefetch([mid, (left + mid) // 2, (mid + 1 + right) // 2])
+                earliest, latest = get_page_date_range(mid)
+
+                if earliest is not None and earliest > end_date:
+                    left = mid + 1
+                else:
+                    right = mid
+
+            first_page = left
+            earliest, latest = get_page_date_range(first_page)
+            # Range falls between two pages or past the last review
+            if earliest is None or latest < start_date:
+                first_page = None
+
     if first_page is None:
         print("No reviews found in target date range")
         return None, None, []
@@ -320,6 +538,9 @@ def find_page_range(driver, product, start_date, end_date, max_page=1000):
 
     while left <= right:
         mid = (left + right) // 2
+        # Speculatively load both midpoints the next step could pick
+        candidates = (mid, (left + mid - 1) // 2, (mid + 1 + right) // 2)
+        prefetch([page for page in candidates if left <= page <= right])
         earliest, latest = get_page_date_range(mid)
 
         if earliest is None:  # No more reviews
@@ -327,25 +548,34 @@ def find_page_range(driver, product, start_date, end_date, max_page=1000):
             continue
 
         if earliest > end_date:
-            # All reviews too new, search earlier pages
-            right = mid - 1
-        elif latest < start_date:
-            # All reviews too old, search later pages
+            # All reviews too new, the last page is later
             left = mid + 1
+        elif latest < start_date:
+            # All reviews too old, the last page is earlier
+            right = mid - 1
         else:
             # This page has reviews in range
             last_page = mid
             left = mid + 1  # Try to find later page
 
-    # Collect all reviews from cached pages within range
-    for page in range(first_page, last_page + 1):
-        if page in page_cache:
-            page_reviews = page_cache[page]
-        else:
-            page_reviews = get_page_reviews(driver, product, page)
+    # Fetch the pages in range the search never visited, in parallel
+    missing_pages = [
+        page for page in range(first_page, last_page + 1) if page not in page_cache
+    ]
+    if missing_pages:
+        print(f"Fetching {len(missing_pages)} remaining pages in parallel...")
+        prefetch(missing_pages)
 
-        filtered = filter_reviews_by_date(page_reviews, start_date, end_date)
-        all_reviews.extend(filtered)
+    # Collect all reviews from cached pages within range
+    all_reviews = filter_reviews_by_date(
+        [
+            review
+            for page in range(first_page, last_page + 1)
+            for review in page_cache[page]
+        ],
+        start_date,
+        end_date,
+    )
 
     return first_page, last_page, all_reviews
 
@@ -360,7 +590,7 @@ def g2_scrape(driver, selected_product, date_range):
         date_range: Dict with 'start' and 'end' date strings (YYYY-MM-DD)
 
     Returns:
-        List of review dictionaries
+        List of G2Review records
     """
     start_date = date_range.get("start") or date_range.get("from")
     end_date = date_range.get("end") or date_range.get("to")
@@ -2,16 +2,18 @@
 G2 product search functionality.
 """
 
-from .utils import check_captcha
+from .utils import check_captcha, driver_wait, get_page_html
 
-import json
+import orjson
 import time
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 from urllib.parse import quote_plus, urlparse
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 
+# Links with tracking data containing item names and pointing to reviews
+SEL_PRODUCT_LINK = 'a[data-event-options*="item_name"][href*="/reviews"]'
+
 
 def g2_search(driver, query):
     """
@@ -31,21 +33,14 @@ def g2_search(driver, query):
     driver.get(url)
 
     # Wait for page to load
-    WebDriverWait(driver, 10).until(
-        EC.presence_of_element_located((By.TAG_NAME, "body"))
-    )
+    driver_wait(driver).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
 
     check_captcha(driver)
 
     # Wait for search results to load
     try:
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located(
-                (
-                    By.CSS_SELECTOR,
-                    'a[data-event-options*="item_name"][href*="/reviews"]',
-                )
-            )
+        driver_wait(driver).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, SEL_PRODUCT_LINK))
         )
     except:
         # No results found or timeout
@@ -54,7 +49,7 @@ def g2_search(driver, query):
     # Small buffer to ensure page is fully settled
     time.sleep(1)
 
-    html_content = driver.page_source
+    html_content = get_page_html(driver)
     return extract_products_and_reviews(html_content)
 
 
@@ -68,18 +63,18 @@ def extract_products_and_reviews(html_content):
     Returns:
         List of dicts containing product name and URL slug
     """
-    soup = BeautifulSoup(html_content, "html.parser")
+    tree = LexborHTMLParser(html_content)
     products = []
     seen_names = set()
 
-    # Selector targets links with tracking data containing item names and pointing to reviews
-    links = soup.select('a[data-event-options*="item_name"][href*="/reviews"]')
+    # Select the product links
+    links = tree.css(SEL_PRODUCT_LINK)
 
     for link in links:
         try:
-            data = json.loads(link["data-event-options"])
+            data = orjson.loads(link.attributes["data-event-options"])
             name = data.get("item_name")
-            url = link.get("href")
+            url = link.attributes.get("href")
 
             if url:
                 url = urlparse(url).path.split("/")[2]
@@ -87,7 +82,7 @@ def extract_products_and_reviews(html_content):
             if name and name not in seen_names:
                 products.append({"name": name, "product_name": url})
                 seen_names.add(name)
-        except (json.JSONDecodeError, KeyError):
+        except (orjson.JSONDecodeError, KeyError):
             continue
 
     return products
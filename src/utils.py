@@ -2,51 +2,271 @@
 Utility functions for the review scraper.
 """
 
+import asyncio
+import os
+import random
+import tempfile
+import threading
 from datetime import datetime
+from time import sleep
+import aiohttp
+import undetected_chromedriver as uc
+from selenium.webdriver.support.ui import WebDriverWait
 
+# Chrome features the scraper never uses, disabled to cut startup and
+# per-page overhead (undetected_chromedriver already adds --no-sandbox
+# and --no-first-run)
+CHROME_FLAGS = [
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--disable-default-apps",
+    "--disable-translate",
+    "--metrics-recording-only",
+    "--mute-audio",
+    "--safebrowsing-disable-auto-update",
+    "--disable-client-side-phishing-detection",
+]
 
-def check_captcha(driver):
+# Phrases of a generic "are you a bot" interstitial
+ROBOT_CHECK_PHRASES = (
+    "i'm not a robot",
+    "i am not a robot",
+    "prove you're human",
+    "are you human",
+    "bot detection",
+)
+
+# At least one of these appears on any page detect_captcha would flag; every
+# *captcha marker (recaptcha, hcaptcha, ...) contains "captcha" itself
+CAPTCHA_MARKERS = (
+    "captcha",
+    "cf-turnstile",
+    "cloudflare",
+    "just a moment",
+    "arkoselabs",
+    *ROBOT_CHECK_PHRASES,
+)
+
+# Resources no scraper reads: web fonts and third-party trackers. Images stay
+# enabled, since CAPTCHA challenges solved manually in the browser use them
+BLOCKED_URL_PATTERNS = [
+    "*.woff",
+    "*.woff2",
+    "*.ttf",
+    "*googletagmanager*",
+    "*google-analytics*",
+    "*doubleclick*",
+    "*hotjar*",
+]
+
+
+def create_driver(user_data_dir):
     """
-    Detect various types of CAPTCHAs on the current page.
+    Launch a Chrome browser backed by a persistent profile.
+
+    Chrome is started with CHROME_FLAGS and a disk cache in the temp
+    directory, and requests matching BLOCKED_URL_PATTERNS are dropped to
+    speed up page loads.
+
+    Args:
+        user_data_dir: Path to the Chrome profile directory
+
+    Returns:
+        undetected_chromedriver Chrome instance
+    """
+    options = uc.ChromeOptions()
+    options.add_argument(f"--user-data-dir={user_data_dir}")
+    for flag in CHROME_FLAGS:
+        options.add_argument(flag)
+    # One cache per profile; running Chrome instances can't share a cache dir
+    cache_dir = os.path.join(
+        tempfile.gettempdir(), f"chrome-cache-{os.path.basename(user_data_dir)}"
+    )
+    options.add_argument(f"--disk-cache-dir={cache_dir}")
+    driver = uc.Chrome(options=options, headless=False)
+
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    return driver
+
+
+def driver_wait(driver, timeout=10):
+    """
+    Get a WebDriverWait for the driver, created once per timeout and reused.
 
     Args:
         driver: Selenium WebDriver instance
+        timeout: Seconds to wait before timing out
 
     Returns:
-        bool: True if CAPTCHA detected, False otherwise
+        WebDriverWait bound to the driver
     """
-    html_content = driver.page_source.lower()
-    original_html = driver.page_source
+    waits = getattr(driver, "_scraper_waits", None)
+    if waits is None:
+        waits = driver._scraper_waits = {}
+    if timeout not in waits:
+        waits[timeout] = WebDriverWait(driver, timeout)
+    return waits[timeout]
+
+
+def get_page_html(driver):
+    """
+    Read the current page's HTML over the DevTools protocol.
+
+    Cheaper than driver.page_source, which serializes the DOM in the browser
+    and relays it through an extra WebDriver JSON round-trip.
+
+    Args:
+        driver: Chrome WebDriver instance
+
+    Returns:
+        str: Serialized HTML of the current document
+    """
+    root = driver.execute_cdp_cmd("DOM.getDocument", {"depth": 0})["root"]
+    result = driver.execute_cdp_cmd("DOM.getOuterHTML", {"nodeId": root["nodeId"]})
+    return result["outerHTML"]
+
+
+def create_http_session(driver, max_connections=16):
+    """
+    Create an aiohttp session that presents itself as the given browser.
+
+    The browser's cookies and User-Agent are copied over so pages that load
+    in Selenium can also be fetched over plain HTTP. Must be called from
+    within a running event loop.
+
+    Args:
+        driver: Selenium WebDriver instance
+        max_connections: Maximum number of concurrent connections
+
+    Returns:
+        aiohttp.ClientSession
+    """
+    return aiohttp.ClientSession(
+        headers={"User-Agent": _driver_user_agent(driver)},
+        cookies=_driver_cookies(driver),
+        connector=aiohttp.TCPConnector(limit=max_connections),
+        timeout=aiohttp.ClientTimeout(total=30),
+    )
+
+
+def update_session_cookies(session, driver):
+    """
+    Copy the browser's current cookies into an aiohttp session.
+
+    Used after a page had to be loaded in the browser, so that any cookies
+    earned there (e.g. a solved challenge) are reused over HTTP.
+
+    Args:
+        session: aiohttp.ClientSession created by create_http_session
+        driver: Selenium WebDriver instance
+    """
+    session.cookie_jar.update_cookies(_driver_cookies(driver))
+
+
+def _driver_user_agent(driver):
+    """Return the browser's User-Agent, read once per driver and reused."""
+    user_agent = getattr(driver, "_scraper_user_agent", None)
+    if user_agent is None:
+        user_agent = driver._scraper_user_agent = driver.execute_script(
+            "return navigator.userAgent"
+        )
+    return user_agent
+
+
+def _driver_cookies(driver):
+    """Return the browser's cookies for the current domain as a name -> value dict."""
+    return {cookie["name"]: cookie["value"] for cookie in driver.get_cookies()}
+
+
+async def fetch_page_html(session, url, content_marker, error_marker=None):
+    """
+    Fetch the raw HTML of a page over HTTP.
+
+    Args:
+        session: aiohttp.ClientSession created by create_http_session
+        url: URL of the page
+        content_marker: Substring of the content the page is fetched for;
+            pages containing it are usable even if they mention a CAPTCHA
+        error_marker: Substring of an error page that counts as a valid
+            (empty) page despite its non-200 status
+
+    Returns:
+        HTML string, or None if the response can't stand in for a browser load
+    """
+    try:
+        async with session.get(url) as response:
+            html_content = await response.text()
+    except (aiohttp.ClientError, asyncio.TimeoutError, UnicodeDecodeError):
+        return None
+
+    if response.status != 200 and not (error_marker and error_marker in html_content):
+        return None
+
+    # Pages without the content are either past the last page or a challenge
+    if content_marker not in html_content and detect_captcha(html_content):
+        return None
+    return html_content
+
+
+def detect_captcha(html_content):
+    """
+    Detect various types of CAPTCHAs in page HTML.
+
+    Args:
+        html_content: Raw HTML string
+
+    Returns:
+        list: Names of the detected CAPTCHA types (empty if none)
+    """
+    lowered = html_content.lower()
+    # Most pages match none of the markers, so bail out before categorizing
+    if not any(marker in lowered for marker in CAPTCHA_MARKERS):
+        return []
+
+    has_captcha = "captcha" in lowered
 
     captcha_indicators = {
         "verification_required": (
-            'class="captcha__human__title"' in original_html
-            and "Verification Required" in original_html
-        ),
-        "recaptcha": (
-            "g-recaptcha" in html_content
-            or "recaptcha" in html_content
-            or "grecaptcha" in html_content
+            has_captcha
+            and 'class="captcha__human__title"' in html_content
+            and "Verification Required" in html_content
         ),
-        "hcaptcha": ("h-captcha" in html_content or "hcaptcha" in html_content),
+        "recaptcha": has_captcha and "recaptcha" in lowered,
+        "hcaptcha": has_captcha and ("hcaptcha" in lowered or "h-captcha" in lowered),
         "cloudflare": (
-            "cf-turnstile" in html_content
-            or "cloudflare" in html_content
-            and "challenge" in html_content
-            or "just a moment" in html_content
+            "cf-turnstile" in lowered
+            or ("cloudflare" in lowered and "challenge" in lowered)
+            or "just a moment" in lowered
+        ),
+        "funcaptcha": (
+            (has_captcha and "funcaptcha" in lowered) or "arkoselabs" in lowered
         ),
-        "funcaptcha": ("funcaptcha" in html_content or "arkoselabs" in html_content),
         "generic": (
-            "captcha" in html_content
-            or "i'm not a robot" in html_content
-            or "i am not a robot" in html_content
-            or "prove you're human" in html_content
-            or "are you human" in html_content
-            or "bot detection" in html_content
+            has_captcha or any(phrase in lowered for phrase in ROBOT_CHECK_PHRASES)
         ),
     }
 
-    detected_types = [name for name, detected in captcha_indicators.items() if detected]
+    return [name for name, detected in captcha_indicators.items() if detected]
+
+
+def check_captcha(driver, html=None):
+    """
+    Detect various types of CAPTCHAs on the current page.
+
+    Args:
+        driver: Selenium WebDriver instance
+        html: Page HTML the caller already read, to avoid fetching it again
+
+    Returns:
+        bool: True if CAPTCHA detected, False otherwise
+    """
+    if html is None:
+        html = get_page_html(driver)
+    detected_types = detect_captcha(html)
 
     if detected_types:
         print(
@@ -57,6 +277,36 @@ def check_captcha(driver):
     return False
 
 
+class AdaptiveThrottle:
+    """
+    Delay between page loads that only kicks in once the site starts throttling.
+
+    Starts at zero, backs off exponentially each time a CAPTCHA shows up and
+    halves again after every clean page. Safe to share between threads.
+    """
+
+    def __init__(self, initial_delay=3.0, max_delay=60.0):
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.delay = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, captcha_detected):
+        """Adjust the delay after a page load."""
+        with self._lock:
+            if captcha_detected:
+                self.delay = min(
+                    self.max_delay, max(self.initial_delay, self.delay * 2)
+                )
+            elif self.delay:
+                self.delay = self.delay / 2 if self.delay > 1 else 0.0
+
+    def wait(self):
+        """Sleep for the current delay (with jitter) before the next page load."""
+        if self.delay:
+            sleep(self.delay * random.uniform(0.8, 1.2))
+
+
 def validate_date_range(date_range_str):
     """
     Validate a date range string.